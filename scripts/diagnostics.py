@@ -15,10 +15,54 @@ import sys
 import time
 import json
 import argparse
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
+import http.client
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+from urllib.error import HTTPError
+
+class ExportAnalysis(NamedTuple):
+    """OTLP HTTP exporter statistics derived from the collector's metrics"""
+    otlphttp_sent_metrics: float = 0.0
+    otlphttp_failed_metrics: float = 0.0
+    otlphttp_queue_size: float = 0.0
+    otlphttp_queue_capacity: float = 0.0
+    total_received_metrics: float = 0.0
+    success_rate: float = 0.0
+    queue_utilization: float = 0.0
+
+_METRIC_PREFIX = b'otelcol_'
+_PREFIX_LEN = len(_METRIC_PREFIX)
+_OTLPHTTP_LABEL = b'exporter="otlphttp"'
+
+# (metric name, required label, ExportAnalysis field) for the current
+# (unit-suffixed) and legacy collector naming styles, as bytes so the
+# /metrics payload is matched without decoding it
+_CURRENT_METRIC_SPECS: Tuple[Tuple[bytes, bytes, str], ...] = (
+    (b'otelcol_exporter_sent_metric_points__datapoints__total', _OTLPHTTP_LABEL, 'otlphttp_sent_metrics'),
+    (b'otelcol_exporter_send_failed_metric_points__datapoints__total', _OTLPHTTP_LABEL, 'otlphttp_failed_metrics'),
+    (b'otelcol_exporter_queue_size__batches_', _OTLPHTTP_LABEL, 'otlphttp_queue_size'),
+    (b'otelcol_exporter_queue_capacity__batches_', _OTLPHTTP_LABEL, 'otlphttp_queue_capacity'),
+    (b'otelcol_receiver_accepted_metric_points__datapoints__total', b'', 'total_received_metrics'),
+)
+_LEGACY_METRIC_SPECS: Tuple[Tuple[bytes, bytes, str], ...] = (
+    (b'otelcol_exporter_sent_metric_points_total', _OTLPHTTP_LABEL, 'otlphttp_sent_metrics'),
+    (b'otelcol_exporter_send_failed_metric_points_total', _OTLPHTTP_LABEL, 'otlphttp_failed_metrics'),
+    (b'otelcol_exporter_queue_size', _OTLPHTTP_LABEL, 'otlphttp_queue_size'),
+    (b'otelcol_exporter_queue_capacity', _OTLPHTTP_LABEL, 'otlphttp_queue_capacity'),
+    (b'otelcol_receiver_accepted_metric_points_total', b'', 'total_received_metrics'),
+)
+_METRIC_SPECS = _CURRENT_METRIC_SPECS + _LEGACY_METRIC_SPECS
+
+# Name after the otelcol_ prefix -> (required label, field index, rank);
+# a current-style value outranks a legacy one for the same field
+_LEGACY_RANK = 1
+_CURRENT_RANK = 2
+_METRIC_SPECS_BY_SUFFIX: Dict[bytes, Tuple[bytes, int, int]] = {
+    name[_PREFIX_LEN:]: (labels, ExportAnalysis._fields.index(key), rank)
+    for rank, specs in ((_LEGACY_RANK, _LEGACY_METRIC_SPECS), (_CURRENT_RANK, _CURRENT_METRIC_SPECS))
+    for name, labels, key in specs
+}
+_METRIC_FIELD_COUNT = len({key for _, _, key in _METRIC_SPECS})
 
 class CollectorDiagnostics:
     def __init__(self, host: str = "localhost"):
@@ -26,213 +70,338 @@ class CollectorDiagnostics:
         self.health_url = f"http://{host}:13133/health"
         self.metrics_url = f"http://{host}:8888/metrics"
         self.zpages_url = f"http://{host}:55679/debug/"
+        # Kept-alive connections reused across continuous monitoring polls
+        self._health_conn = http.client.HTTPConnection(host, 13133, timeout=10)
+        self._metrics_conn = http.client.HTTPConnection(host, 8888, timeout=10)
+        # Set while continuous monitoring runs, to fetch both endpoints in parallel
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # fetch_export_analysis result shared within one run_diagnostics call
+        self._metrics_cache: Optional[Tuple[bool, Union[ExportAnalysis, str]]] = None
+        # Banner timestamp, reformatted only when the wall-clock second changes
+        self._last_ts_sec = -1
+        self._last_ts_str = ""
+        # Report text that does not change between runs, built once
+        self._banner_head = "\n".join([
+            "=" * 70,
+            "🔍 DYNATRACE OTEL COLLECTOR DIAGNOSTICS",
+            "=" * 70,
+            "📅 Timestamp: ",
+        ])
+        self._banner_tail = "\n".join([
+            "",
+            f"🖥️  Host: {host}",
+            "=" * 70,
+            "",
+        ])
+        self._endpoints_block = "\n".join([
+            "",
+            "🔗 MONITORING ENDPOINTS",
+            "-" * 50,
+            "🏥 Health Check: http://localhost:13133/health",
+            "📊 Metrics (Prometheus): http://localhost:8888/metrics",
+            "🔍 zPages Web UI: http://localhost:55679/debug/",
+            "   • ServiceZ: http://localhost:55679/debug/servicez",
+            "   • PipelineZ: http://localhost:55679/debug/pipelinez",
+            "   • ExtensionZ: http://localhost:55679/debug/extensionz",
+            "",
+        ])
         
+    def _timestamp(self) -> str:
+        """Return the current local time as 'YYYY-mm-dd HH:MM:SS'"""
+        now = int(time.time())
+        if now != self._last_ts_sec:
+            self._last_ts_sec = now
+            self._last_ts_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+        return self._last_ts_str
+
     def print_banner(self):
         """Print diagnostic banner with timestamp"""
-        print("=" * 70)
-        print("🔍 DYNATRACE OTEL COLLECTOR DIAGNOSTICS")
-        print("=" * 70)
-        print(f"📅 Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"🖥️  Host: {self.host}")
-        print("=" * 70)
+        sys.stdout.write(self._banner_head + self._timestamp() + self._banner_tail)
+
+    def _open(self, conn: http.client.HTTPConnection, path: str) -> http.client.HTTPResponse:
+        """GET path over a persistent connection, reconnecting once if the idle socket was dropped"""
+        for attempt in range(2):
+            try:
+                conn.request('GET', path, headers={'Connection': 'keep-alive'})
+                response = conn.getresponse()
+            except (ConnectionResetError, BrokenPipeError):
+                # Covers RemoteDisconnected: the collector closed the kept-alive socket
+                conn.close()
+                if attempt:
+                    raise
+                continue
+            except Exception:
+                conn.close()
+                raise
+            if response.status != 200:
+                response.read()
+                url = f"http://{conn.host}:{conn.port}{path}"
+                raise HTTPError(url, response.status, response.reason, response.headers, None)
+            return response
+
+    def _get(self, conn: http.client.HTTPConnection, path: str) -> bytes:
+        """GET path and return the whole response body"""
+        response = self._open(conn, path)
+        try:
+            return response.read()
+        except Exception:
+            conn.close()
+            raise
 
     def check_health(self) -> Tuple[bool, str]:
         """Check collector health status"""
         try:
-            with urlopen(self.health_url, timeout=10) as response:
-                status = response.read().decode('utf-8')
-                return True, status.strip()
-        except (URLError, HTTPError) as e:
+            status = self._get(self._health_conn, '/health').decode('utf-8')
+            return True, status.strip()
+        except (OSError, http.client.HTTPException) as e:
             return False, f"Health check failed: {e}"
         except Exception as e:
             return False, f"Unexpected error: {e}"
 
-    def get_metrics(self) -> Tuple[bool, str]:
-        """Fetch Prometheus metrics"""
+    def iter_metrics_chunks(self, read_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Stream the Prometheus metrics payload in blocks of whole lines"""
+        response = self._open(self._metrics_conn, '/metrics')
         try:
-            with urlopen(self.metrics_url, timeout=10) as response:
-                metrics = response.read().decode('utf-8')
-                return True, metrics
-        except (URLError, HTTPError) as e:
+            partial = b''
+            while True:
+                block = response.read(read_size)
+                if not block:
+                    break
+                # Hold back the trailing partial line until the next block
+                cut = block.rfind(b'\n') + 1
+                if not cut:
+                    partial += block
+                    continue
+                yield partial + block[:cut]
+                partial = block[cut:]
+            if partial:
+                yield partial
+        finally:
+            if not response.isclosed():
+                # The consumer stopped early: drain the unparsed rest so the
+                # kept-alive connection can serve the next poll
+                try:
+                    while response.read(read_size):
+                        pass
+                except (OSError, http.client.HTTPException):
+                    self._metrics_conn.close()
+
+    def fetch_export_analysis(self) -> Tuple[bool, Union[ExportAnalysis, str]]:
+        """Stream Prometheus metrics into analyze_export_metrics"""
+        chunks = self.iter_metrics_chunks()
+        try:
+            return True, self.analyze_export_metrics(chunks)
+        except (OSError, http.client.HTTPException) as e:
             return False, f"Metrics fetch failed: {e}"
         except Exception as e:
             return False, f"Unexpected error: {e}"
+        finally:
+            chunks.close()
 
-    def parse_metric_value(self, metrics_text: str, metric_name: str, labels: str = "") -> Optional[float]:
-        """Extract metric value from Prometheus format text"""
-        lines = metrics_text.split('\n')
-        
-        for line in lines:
-            if line.startswith(metric_name):
-                # Check if this line contains the required labels (if any)
-                if labels and labels not in line:
+    def analyze_export_metrics(self, metrics_chunks: Union[bytes, Iterable[bytes]]) -> ExportAnalysis:
+        """Analyze OTLP HTTP exporter metrics from a whole payload or from newline-terminated blocks of it"""
+        if isinstance(metrics_chunks, bytes):
+            metrics_chunks = (metrics_chunks,)
+        # Parsed metric values, indexed like the leading ExportAnalysis fields
+        values = [0.0] * _METRIC_FIELD_COUNT
+
+        # Single pass over line offsets in each block, stopping once every field
+        # holds a current-style value
+        ranks = [0] * _METRIC_FIELD_COUNT
+        remaining = _METRIC_FIELD_COUNT
+        for chunk in metrics_chunks:
+            pos = 0
+            chunk_end = len(chunk)
+            while pos < chunk_end:
+                start = pos
+                end = chunk.find(b'\n', start)
+                if end == -1:
+                    end = chunk_end
+                pos = end + 1
+                # Skip blank and HELP/TYPE lines, then anything not otelcol_*
+                if start == end or chunk[start] == 0x23:  # '#'
+                    continue
+                if not chunk.startswith(_METRIC_PREFIX, start, end):
+                    continue
+                name_start = start + _PREFIX_LEN
+                name_end = chunk.find(b'{', name_start, end)
+                if name_end == -1:
+                    name_end = chunk.find(b' ', name_start, end)
+                    if name_end == -1:
+                        continue
+                spec = _METRIC_SPECS_BY_SUFFIX.get(chunk[name_start:name_end])
+                if spec is None:
                     continue
+                labels, slot, rank = spec
+                if rank <= ranks[slot]:
+                    continue
+                # The value is the token right after the label set; an optional
+                # timestamp may follow it. float() parses the bytes slice directly.
+                if chunk[name_end] == 0x7B:  # '{'
+                    labels_end = chunk.find(b'} ', name_end, end)
+                    if labels_end == -1:
+                        continue
+                    value_start = labels_end + 2
+                else:
+                    labels_end = name_end
+                    value_start = name_end + 1
+                # Search for the required label within the label set only
+                if labels and chunk.find(labels, name_end, labels_end) == -1:
+                    continue
+                value_end = chunk.find(b' ', value_start, end)
                 try:
-                    # Extract value (last part after space)
-                    value_str = line.split()[-1]
-                    return float(value_str)
-                except (ValueError, IndexError):
+                    values[slot] = float(chunk[value_start:value_end if value_end != -1 else end])
+                except ValueError:
                     continue
-        return None
-
-    def analyze_export_metrics(self, metrics_text: str) -> Dict[str, any]:
-        """Analyze OTLP HTTP exporter metrics"""
-        analysis = {
-            'otlphttp_sent_metrics': 0,
-            'otlphttp_failed_metrics': 0,
-            'otlphttp_queue_size': 0,
-            'otlphttp_queue_capacity': 0,
-            'total_received_metrics': 0,
-            'success_rate': 0.0,
-            'queue_utilization': 0.0
-        }
-
-        # Extract OTLP HTTP exporter specific metrics (try both metric name formats)
-        analysis['otlphttp_sent_metrics'] = (
-            self.parse_metric_value(metrics_text, 'otelcol_exporter_sent_metric_points__datapoints__total', 'exporter="otlphttp"') or
-            self.parse_metric_value(metrics_text, 'otelcol_exporter_sent_metric_points_total', 'exporter="otlphttp"') or 0
-        )
+                ranks[slot] = rank
+                if rank == _CURRENT_RANK:
+                    remaining -= 1
+                    if not remaining:
+                        break
+            if not remaining:
+                break
 
-        analysis['otlphttp_failed_metrics'] = (
-            self.parse_metric_value(metrics_text, 'otelcol_exporter_send_failed_metric_points__datapoints__total', 'exporter="otlphttp"') or
-            self.parse_metric_value(metrics_text, 'otelcol_exporter_send_failed_metric_points_total', 'exporter="otlphttp"') or 0
-        )
-
-        analysis['otlphttp_queue_size'] = (
-            self.parse_metric_value(metrics_text, 'otelcol_exporter_queue_size__batches_', 'exporter="otlphttp"') or
-            self.parse_metric_value(metrics_text, 'otelcol_exporter_queue_size', 'exporter="otlphttp"') or 0
-        )
-
-        analysis['otlphttp_queue_capacity'] = (
-            self.parse_metric_value(metrics_text, 'otelcol_exporter_queue_capacity__batches_', 'exporter="otlphttp"') or
-            self.parse_metric_value(metrics_text, 'otelcol_exporter_queue_capacity', 'exporter="otlphttp"') or 0
-        )
-
-        # Total metrics received by collector (try both formats)
-        analysis['total_received_metrics'] = (
-            self.parse_metric_value(metrics_text, 'otelcol_receiver_accepted_metric_points__datapoints__total') or
-            self.parse_metric_value(metrics_text, 'otelcol_receiver_accepted_metric_points_total') or 0
-        )
+        sent, failed, queue_size, queue_capacity, received = values
 
         # Calculate success rate
-        total_attempts = analysis['otlphttp_sent_metrics'] + analysis['otlphttp_failed_metrics']
+        success_rate = 0.0
+        total_attempts = sent + failed
         if total_attempts > 0:
-            analysis['success_rate'] = (analysis['otlphttp_sent_metrics'] / total_attempts) * 100
+            success_rate = (sent / total_attempts) * 100
 
         # Calculate queue utilization
-        if analysis['otlphttp_queue_capacity'] > 0:
-            analysis['queue_utilization'] = (analysis['otlphttp_queue_size'] / analysis['otlphttp_queue_capacity']) * 100
+        queue_utilization = 0.0
+        if queue_capacity > 0:
+            queue_utilization = (queue_size / queue_capacity) * 100
+
+        return ExportAnalysis(sent, failed, queue_size, queue_capacity, received, success_rate, queue_utilization)
 
-        return analysis
+    def _analysis(self) -> Tuple[bool, Union[ExportAnalysis, str]]:
+        """Fetch and analyze export metrics, reusing the result within the current tick"""
+        if self._metrics_cache is None:
+            self._metrics_cache = self.fetch_export_analysis()
+        return self._metrics_cache
 
-    def print_health_status(self):
+    def _prefetch(self) -> Tuple[bool, str]:
+        """Check health and fill the export analysis cache, in parallel when an executor is set"""
+        if self._executor is None:
+            return self.check_health()
+        health = self._executor.submit(self.check_health)
+        export = self._executor.submit(self._analysis)
+        export.result()
+        return health.result()
+
+    def print_health_status(self, health: Optional[Tuple[bool, str]] = None):
         """Print health check results"""
-        print("\n🏥 HEALTH CHECK")
-        print("-" * 50)
+        lines = ["\n🏥 HEALTH CHECK", "-" * 50]
         
-        is_healthy, status_message = self.check_health()
+        is_healthy, status_message = health or self.check_health()
         
         if is_healthy:
-            print(f"✅ Status: {status_message}")
-            print("🔗 Health Endpoint: http://localhost:13133/health")
+            lines.append(f"✅ Status: {status_message}")
+            lines.append("🔗 Health Endpoint: http://localhost:13133/health")
         else:
-            print(f"❌ Status: {status_message}")
-            print("💡 Troubleshooting:")
-            print("   - Ensure collector container is running")
-            print("   - Verify port 13133 is exposed")
-            print("   - Check docker-compose logs for errors")
+            lines.append(f"❌ Status: {status_message}")
+            lines.append("💡 Troubleshooting:")
+            lines.append("   - Ensure collector container is running")
+            lines.append("   - Verify port 13133 is exposed")
+            lines.append("   - Check docker-compose logs for errors")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def print_export_statistics(self):
         """Print OTLP HTTP exporter statistics"""
-        print("\n📊 OTLP HTTP EXPORTER STATISTICS")
-        print("-" * 50)
+        lines = ["\n📊 OTLP HTTP EXPORTER STATISTICS", "-" * 50]
         
-        metrics_success, metrics_data = self.get_metrics()
+        metrics_success, analysis = self._analysis()
         
         if not metrics_success:
-            print(f"❌ Unable to fetch metrics: {metrics_data}")
-            print("💡 Troubleshooting:")
-            print("   - Ensure collector container is running")
-            print("   - Verify port 8888 is exposed")
-            print("   - Check internal telemetry configuration")
+            lines.append(f"❌ Unable to fetch metrics: {analysis}")
+            lines.append("💡 Troubleshooting:")
+            lines.append("   - Ensure collector container is running")
+            lines.append("   - Verify port 8888 is exposed")
+            lines.append("   - Check internal telemetry configuration")
+            sys.stdout.write("\n".join(lines) + "\n")
             return
-
-        analysis = self.analyze_export_metrics(metrics_data)
         
         # Export Success/Failure
-        print(f"📤 Metrics Sent to Dynatrace: {int(analysis['otlphttp_sent_metrics']):,}")
-        print(f"❌ Failed Export Attempts: {int(analysis['otlphttp_failed_metrics']):,}")
-        print(f"📈 Success Rate: {analysis['success_rate']:.1f}%")
+        lines.append(f"📤 Metrics Sent to Dynatrace: {int(analysis.otlphttp_sent_metrics):,}")
+        lines.append(f"❌ Failed Export Attempts: {int(analysis.otlphttp_failed_metrics):,}")
+        lines.append(f"📈 Success Rate: {analysis.success_rate:.1f}%")
         
         # Queue Status  
-        print(f"📋 Export Queue Size: {int(analysis['otlphttp_queue_size']):,}")
-        print(f"📦 Queue Capacity: {int(analysis['otlphttp_queue_capacity']):,}")
-        print(f"⚡ Queue Utilization: {analysis['queue_utilization']:.1f}%")
+        lines.append(f"📋 Export Queue Size: {int(analysis.otlphttp_queue_size):,}")
+        lines.append(f"📦 Queue Capacity: {int(analysis.otlphttp_queue_capacity):,}")
+        lines.append(f"⚡ Queue Utilization: {analysis.queue_utilization:.1f}%")
         
         # Overall Pipeline Health
-        print(f"🔄 Total Metrics Received: {int(analysis['total_received_metrics']):,}")
+        lines.append(f"🔄 Total Metrics Received: {int(analysis.total_received_metrics):,}")
+        sys.stdout.write("\n".join(lines) + "\n")
         
         # Status Assessment
         self.print_status_assessment(analysis)
 
-    def print_status_assessment(self, analysis: Dict[str, any]):
+    def print_status_assessment(self, analysis: ExportAnalysis):
         """Print overall status assessment and recommendations"""
-        print(f"\n🎯 STATUS ASSESSMENT")
-        print("-" * 50)
+        lines = ["\n🎯 STATUS ASSESSMENT", "-" * 50]
         
         # Success rate assessment
-        success_rate = analysis['success_rate']
+        success_rate = analysis.success_rate
         if success_rate >= 95:
-            print("✅ Export Health: EXCELLENT")
+            lines.append("✅ Export Health: EXCELLENT")
         elif success_rate >= 80:
-            print("⚠️  Export Health: GOOD (monitor for improvements)")
+            lines.append("⚠️  Export Health: GOOD (monitor for improvements)")
         elif success_rate >= 50:
-            print("🟡 Export Health: DEGRADED (investigate failures)")
+            lines.append("🟡 Export Health: DEGRADED (investigate failures)")
         else:
-            print("🔴 Export Health: CRITICAL (immediate attention required)")
+            lines.append("🔴 Export Health: CRITICAL (immediate attention required)")
 
         # Queue utilization assessment
-        queue_util = analysis['queue_utilization']
+        queue_util = analysis.queue_utilization
         if queue_util < 50:
-            print("✅ Queue Status: HEALTHY")
+            lines.append("✅ Queue Status: HEALTHY")
         elif queue_util < 80:
-            print("⚠️  Queue Status: MODERATE (monitor load)")
+            lines.append("⚠️  Queue Status: MODERATE (monitor load)")
         else:
-            print("🔴 Queue Status: HIGH (risk of data loss)")
+            lines.append("🔴 Queue Status: HIGH (risk of data loss)")
 
         # Recommendations
-        if analysis['otlphttp_failed_metrics'] > 0:
-            print("\n💡 RECOMMENDATIONS:")
-            print("   - Check Dynatrace API token permissions")
-            print("   - Verify DT_ENDPOINT configuration")
-            print("   - Review network connectivity to Dynatrace")
-            print("   - Check collector logs: docker-compose logs collector")
+        if analysis.otlphttp_failed_metrics > 0:
+            lines.append("\n💡 RECOMMENDATIONS:")
+            lines.append("   - Check Dynatrace API token permissions")
+            lines.append("   - Verify DT_ENDPOINT configuration")
+            lines.append("   - Review network connectivity to Dynatrace")
+            lines.append("   - Check collector logs: docker-compose logs collector")
 
         if queue_util > 70:
-            print("\n💡 QUEUE RECOMMENDATIONS:")
-            print("   - Consider increasing queue_size in configuration")
-            print("   - Add more num_consumers for parallel processing")
-            print("   - Review batch processor settings")
+            lines.append("\n💡 QUEUE RECOMMENDATIONS:")
+            lines.append("   - Consider increasing queue_size in configuration")
+            lines.append("   - Add more num_consumers for parallel processing")
+            lines.append("   - Review batch processor settings")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def print_monitoring_endpoints(self):
         """Print available monitoring endpoints"""
-        print("\n🔗 MONITORING ENDPOINTS")
-        print("-" * 50)
-        print(f"🏥 Health Check: http://localhost:13133/health")
-        print(f"📊 Metrics (Prometheus): http://localhost:8888/metrics")
-        print(f"🔍 zPages Web UI: http://localhost:55679/debug/")
-        print(f"   • ServiceZ: http://localhost:55679/debug/servicez")
-        print(f"   • PipelineZ: http://localhost:55679/debug/pipelinez")
-        print(f"   • ExtensionZ: http://localhost:55679/debug/extensionz")
+        sys.stdout.write(self._endpoints_block)
 
     def run_diagnostics(self, health_only=False, metrics_only=False, export_stats_only=False):
         """Run comprehensive diagnostics"""
+        # Each run fetches /metrics afresh, including after a failed fetch
+        self._metrics_cache = None
         self.print_banner()
+
+        show_health = health_only or not (metrics_only or export_stats_only)
+        show_export = metrics_only or export_stats_only or not (health_only)
+
+        health = None
+        if show_health and show_export:
+            health = self._prefetch()
         
-        if health_only or not (metrics_only or export_stats_only):
-            self.print_health_status()
+        if show_health:
+            self.print_health_status(health)
             
-        if metrics_only or export_stats_only or not (health_only):
+        if show_export:
             self.print_export_statistics()
             
         if not (health_only or metrics_only or export_stats_only):
@@ -243,6 +412,7 @@ class CollectorDiagnostics:
         print(f"🔄 Starting continuous monitoring (interval: {interval}s)")
         print("Press Ctrl+C to stop...")
         
+        self._executor = ThreadPoolExecutor(max_workers=2)
         try:
             while True:
                 self.run_diagnostics()
@@ -251,6 +421,9 @@ class CollectorDiagnostics:
                 time.sleep(interval)
         except KeyboardInterrupt:
             print("\n\n🛑 Monitoring stopped by user")
+        finally:
+            self._executor.shutdown(wait=False)
+            self._executor = None
 
 def main():
     parser = argparse.ArgumentParser(description='Dynatrace OTel Collector Diagnostics')